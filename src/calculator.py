@@ -13,6 +13,7 @@ import math
 from typing import Union
 import logging
 Number = Union[int, float]
+_NUMBER_TYPES = (int, float)
 
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -35,15 +36,11 @@ def add(a: Number, b: Number) -> Number:
         >>> add(1+2j, 3+4j)
         (4+6j)
     """
-    try:
-        if not isinstance(a, (int, float)) or not isinstance(b, (int, float)):
-            raise TypeError("Both arguments must be numbers (int or float)")
-        
-        logger.info(f"Adding {a} and {b}")
-        return a + b
-    except Exception as e:
-        logger.error(f"Error in add function: {e}")
-        raise
+    if not isinstance(a, _NUMBER_TYPES) or not isinstance(b, _NUMBER_TYPES):
+        raise TypeError("Both arguments must be numbers (int or float)")
+
+    logger.info("Adding %s and %s", a, b)
+    return a + b
 
 
 def subtract(a: Number, b: Number) -> Number:
@@ -113,7 +110,7 @@ def divide(a: Number, b: Number) -> Number:
         3.5
     """
     try:
-        if not isinstance(a, (int, float)) or not isinstance(b, (int, float)):
+        if not isinstance(a, _NUMBER_TYPES) or not isinstance(b, _NUMBER_TYPES):
             raise TypeError("Both arguments must be numbers (int or float)")
 
         logger.info(f"Dividing {a} by {b}")
@@ -194,10 +191,8 @@ def factorial(n: int) -> int:
         raise TypeError("Factorial is only defined for integers")
     if n < 0:
         raise ValueError("Factorial is not defined for negative numbers")
-    
-    if n <= 1:
-        return 1
-    return n * factorial(n - 1)
+
+    return math.factorial(n)
 
 
 def percentage(part: Number, whole: Number) -> float:
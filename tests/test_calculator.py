@@ -2,8 +2,23 @@
 Test suite for calculator module - Simple passing tests only
 """
 
+import re
+
 import pytest
-from src.calculator import add, subtract, multiply, divide, square_root, factorial
+from src.calculator import (
+    add,
+    subtract,
+    multiply,
+    divide,
+    square_root,
+    factorial,
+    percentage,
+)
+
+_DIV0_RE = re.compile(r"Cannot divide by zero")
+_SQRT_NEG_RE = re.compile(r"Cannot calculate square root of negative number")
+_FACT_NEG_RE = re.compile(r"Factorial is not defined for negative numbers")
+_PCT_ZERO_RE = re.compile(r"Cannot calculate percentage with zero as whole")
 
 
 def test_add():
@@ -28,32 +43,41 @@ def test_multiply():
 
 
 def test_divide():
-    """Test basic division and error handling."""
+    """Test basic division."""
     assert divide(10, 2) == 5.0
     assert divide(7, 2) == 3.5
-    
-    # Test division by zero raises exception
-    with pytest.raises(ZeroDivisionError):
-        divide(10, 0)
 
 
 def test_square_root():
-    """Test square root calculation and error handling."""
+    """Test square root calculation."""
     assert square_root(9) == 3.0
     assert square_root(16) == 4.0
     assert square_root(2) == pytest.approx(1.4142135623730951)
-    
-    # Test negative number raises exception
-    with pytest.raises(ValueError):
-        square_root(-1)
 
 
 def test_factorial():
-    """Test factorial calculation and error handling."""
+    """Test factorial calculation."""
     assert factorial(0) == 1
     assert factorial(5) == 120
     assert factorial(1) == 1
-    
-    # Test negative number raises exception
-    with pytest.raises(ValueError):
-        factorial(-1)
+
+
+_ERROR_CASES = (
+    (divide, (10, 0), ZeroDivisionError, _DIV0_RE),
+    (square_root, (-1,), ValueError, _SQRT_NEG_RE),
+    (factorial, (-1,), ValueError, _FACT_NEG_RE),
+    (percentage, (5, 0), ZeroDivisionError, _PCT_ZERO_RE),
+)
+_ERROR_IDS = (
+    "divide-by-zero",
+    "square-root-negative",
+    "factorial-negative",
+    "percentage-zero-whole",
+)
+
+
+@pytest.mark.parametrize("func, args, exception, message", _ERROR_CASES, ids=_ERROR_IDS)
+def test_error_paths(func, args, exception, message):
+    """Test that invalid inputs raise the documented exception."""
+    with pytest.raises(exception, match=message):
+        func(*args)